@@ -26,9 +26,12 @@ from .connection.connection import (
 
 # Helpers for creating connections from arrays
 from .connection.array_connection import (
+    build_cursor_index,
     connection_from_array,
     connection_from_array_slice,
+    connection_from_array_slice_streaming,
     cursor_for_object_in_connection,
+    cursor_for_object_in_connection_indexed,
     cursor_to_offset,
     offset_to_cursor,
     SizedSliceable,
@@ -58,6 +61,7 @@ __version_info_js__ = version_info_js
 
 __all__ = [
     "backward_connection_args",
+    "build_cursor_index",
     "Connection",
     "ConnectionArguments",
     "ConnectionConstructor",
@@ -66,8 +70,10 @@ __all__ = [
     "connection_args",
     "connection_from_array",
     "connection_from_array_slice",
+    "connection_from_array_slice_streaming",
     "connection_definitions",
     "cursor_for_object_in_connection",
+    "cursor_for_object_in_connection_indexed",
     "cursor_to_offset",
     "Edge",
     "EdgeConstructor",
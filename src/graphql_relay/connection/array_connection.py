@@ -1,11 +1,23 @@
-from typing import Any, Iterator, List, Tuple, Optional, Sequence
+from binascii import a2b_base64, b2a_base64
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Optional,
+    Sequence,
+)
 
 try:
     from typing import Protocol
 except ImportError:  # Python < 3.8
     from typing_extensions import Protocol  # type: ignore
 
-from ..utils.base64 import base64, unbase64
 from .connection import (
     Connection,
     ConnectionArguments,
@@ -20,9 +32,12 @@ from .connection import (
 )
 
 __all__ = [
+    "build_cursor_index",
     "connection_from_array",
     "connection_from_array_slice",
+    "connection_from_array_slice_streaming",
     "cursor_for_object_in_connection",
+    "cursor_for_object_in_connection_indexed",
     "cursor_to_offset",
     "offset_to_cursor",
     "SizedSliceable",
@@ -70,6 +85,163 @@ def connection_from_array(
     )
 
 
+def _build_validation_table() -> Tuple[Optional[str], ...]:
+    """Precompute the validation error for each argument combination.
+
+    The table is indexed by a bitmask of the presence of the `first`,
+    `last`, `before` and `after` arguments, so validating a call becomes
+    a single lookup instead of a chain of truthiness checks.
+    """
+    table: List[Optional[str]] = []
+    for mask in range(16):
+        first, last = mask & 8, mask & 4
+        before, after = mask & 2, mask & 1
+        if first and last:
+            error: Optional[str] = "Mixing 'first' and 'last' is not supported."
+        elif before and after:
+            error = "Mixing 'before' and 'after' is not supported."
+        elif first and before:
+            error = "Mixing 'first' and 'before' is not supported."
+        elif last and after:
+            error = "Mixing 'last' and 'after' is not supported."
+        else:
+            error = None
+        table.append(error)
+    return tuple(table)
+
+
+_VALIDATION_TABLE = _build_validation_table()
+
+
+def _make_connection_builder(
+    connection_type: ConnectionConstructor,
+    edge_type: EdgeConstructor,
+    page_info_type: PageInfoConstructor,
+    lazy: bool = False,
+) -> Callable[..., ConnectionType]:
+    """Create a connection builder specialized for the given types.
+
+    The constructors are captured in the closure, so the hot path does not
+    have to plumb them through keyword arguments on every call. With `lazy`,
+    the edges of the built connections are iterators instead of lists.
+    """
+
+    def build_connection(
+        array_slice: SizedSliceable,
+        args: Optional[ConnectionArguments] = None,
+        slice_start: int = 0,
+        array_length: Optional[int] = None,
+        array_slice_length: Optional[int] = None,
+    ) -> ConnectionType:
+        args = args or {}
+        before: Optional[str] = args.get("before")
+        after: Optional[str] = args.get("after")
+        first: Optional[int] = args.get("first")
+        last: Optional[int] = args.get("last")
+
+        # Possible combinations are:
+        # - first and after
+        # - last and before
+
+        error = _VALIDATION_TABLE[
+            bool(first) << 3 | bool(last) << 2 | bool(before) << 1 | bool(after)
+        ]
+        if error is not None:
+            raise ValueError(error)
+
+        # If the `array_slice_length` is provided, use it as `array_length`.
+        if array_slice_length is not None:
+            array_length = array_slice_length
+
+        # If `after` is provided, but `first` is not, or if `first` and `last` are not provided at all,
+        # calculate `first` by using the `array_length`
+        # or fall back to calculating the array length (which can be an expensive operation, hence being the last resort).
+        if first is None and (after or last is None):
+            if array_length is not None:
+                first = array_length
+            else:
+                array_length = len(array_slice)
+                first = array_length
+
+        # If `before` is provided, but `last` is not,
+        # calculate `last` by using the `array_length`
+        # or fall back to calculating the array length (which can be an expensive operation, hence being the last resort).
+        if last is None and before:
+            last = array_length
+
+        # If `last` or `before` were provided
+        if last is not None:
+            (
+                edges,
+                has_previous_page,
+                has_next_page,
+                first_edge_cursor,
+                last_edge_cursor,
+            ) = _handle_last_before(
+                array_slice=array_slice,
+                array_length=array_length,
+                last=last,
+                before=before,
+                slice_start=slice_start,
+                edge_type=edge_type,
+                lazy=lazy,
+            )
+
+        # If `first` or `after` are provided
+        else:
+            assert first is not None
+            (
+                edges,
+                has_previous_page,
+                has_next_page,
+                first_edge_cursor,
+                last_edge_cursor,
+            ) = _handle_first_after(
+                array_slice=array_slice,
+                array_length=array_length,
+                first=first,
+                after=after,
+                slice_start=slice_start,
+                edge_type=edge_type,
+                lazy=lazy,
+            )
+
+        return connection_type(
+            edges=edges,
+            pageInfo=page_info_type(
+                startCursor=first_edge_cursor,
+                endCursor=last_edge_cursor,
+                hasPreviousPage=has_previous_page,
+                hasNextPage=has_next_page,
+            ),
+        )
+
+    return build_connection
+
+
+# Cache the specialized builders, since in practice schemas only use a small
+# number of connection, edge and page info types.
+_connection_builders: Dict[
+    Tuple[ConnectionConstructor, EdgeConstructor, PageInfoConstructor, bool],
+    Callable[..., ConnectionType],
+] = {}
+
+
+def _get_connection_builder(
+    connection_type: ConnectionConstructor,
+    edge_type: EdgeConstructor,
+    page_info_type: PageInfoConstructor,
+    lazy: bool = False,
+) -> Callable[..., ConnectionType]:
+    key = (connection_type, edge_type, page_info_type, lazy)
+    build_connection = _connection_builders.get(key)
+    if build_connection is None:
+        build_connection = _connection_builders[key] = _make_connection_builder(
+            connection_type, edge_type, page_info_type, lazy
+        )
+    return build_connection
+
+
 def connection_from_array_slice(
     array_slice: SizedSliceable,
     args: Optional[ConnectionArguments] = None,
@@ -98,129 +270,149 @@ def connection_from_array_slice(
     the beginning of the result set, and if you do not provide an `array_length`,
     we assume that the slice ends at the end of the result set.
     """
-    args = args or {}
-    before: Optional[str] = args.get("before")
-    after: Optional[str] = args.get("after")
-    first: Optional[int] = args.get("first")
-    last: Optional[int] = args.get("last")
-
-    # Possible combinations are:
-    # - first and after
-    # - last and before
-
-    if first and last:
-        raise ValueError("Mixing 'first' and 'last' is not supported.")
-
-    if before and after:
-        raise ValueError("Mixing 'before' and 'after' is not supported.")
-
-    if first and before:
-        raise ValueError("Mixing 'first' and 'before' is not supported.")
-
-    if last and after:
-        raise ValueError("Mixing 'last' and 'after' is not supported.")
-
-    # If the `array_slice_length` is provided, use it as `array_length`.
-    if array_slice_length is not None:
-        array_length = array_slice_length
-
-    # If `after` is provided, but `first` is not, or if `first` and `last` are not provided at all,
-    # calculate `first` by using the `array_length`
-    # or fall back to calculating the array length (which can be an expensive operation, hence being the last resort).
-    if first is None and (after or last is None):
-        if array_length is not None:
-            first = array_length
-        else:
-            array_length = len(array_slice)
-            first = array_length
-
-    # If `before` is provided, but `last` is not,
-    # calculate `last` by using the `array_length`
-    # or fall back to calculating the array length (which can be an expensive operation, hence being the last resort).
-    if last is None and before:
-        last = array_length
-
-    # If `last` or `before` were provided
-    if last is not None:
-        (edges, has_previous_page, has_next_page,) = _handle_last_before(
-            array_slice=array_slice,
-            array_length=array_length,
-            last=last,
-            before=before,
-            slice_start=slice_start,
-            edge_type=edge_type,
-        )
+    build_connection = _get_connection_builder(
+        connection_type, edge_type, page_info_type
+    )
+    return build_connection(
+        array_slice, args, slice_start, array_length, array_slice_length
+    )
 
-    # If `first` or `after` are provided
-    else:
-        assert first is not None
-        (edges, has_previous_page, has_next_page,) = _handle_first_after(
-            array_slice=array_slice,
-            array_length=array_length,
-            first=first,
-            after=after,
-            slice_start=slice_start,
-            edge_type=edge_type,
-        )
 
-    first_edge_cursor: Optional[str] = edges[0].cursor if edges else None
-    last_edge_cursor: Optional[str] = edges[-1].cursor if edges else None
-
-    return connection_type(
-        edges=edges,
-        pageInfo=page_info_type(
-            startCursor=first_edge_cursor,
-            endCursor=last_edge_cursor,
-            hasPreviousPage=has_previous_page,
-            hasNextPage=has_next_page,
-        ),
+def connection_from_array_slice_streaming(
+    array_slice: SizedSliceable,
+    args: Optional[ConnectionArguments] = None,
+    slice_start: int = 0,
+    array_length: Optional[int] = None,
+    array_slice_length: Optional[int] = None,
+    connection_type: ConnectionConstructor = Connection,
+    edge_type: EdgeConstructor = Edge,
+    page_info_type: PageInfoConstructor = PageInfo,
+) -> ConnectionType:
+    """Create a connection object with lazily built edges.
+
+    This behaves like `connection_from_array_slice`, except that the edges
+    of the returned connection are an iterator that creates the edge objects
+    on demand, keeping peak memory proportional to a single edge instead of
+    the whole page. The page info is computed up front from the known
+    offsets. Note that the edges can only be iterated once, so this is meant
+    for consumers that serialize a page incrementally.
+
+    Since the page info is derived from the offsets without materializing
+    the page, it assumes the given lengths are accurate: if the slice turns
+    out to be shorter than the declared `array_length`, the start and end
+    cursors may refer to edges that are never yielded. Use the non-streaming
+    `connection_from_array_slice` when the lengths are not reliable.
+    """
+    build_connection = _get_connection_builder(
+        connection_type, edge_type, page_info_type, lazy=True
+    )
+    return build_connection(
+        array_slice, args, slice_start, array_length, array_slice_length
     )
 
 
 PREFIX = "arrayconnection:"
+PREFIX_B = PREFIX.encode("ascii")
+_PREFIX_FORMAT = PREFIX_B + b"%d"
+_PREFIX_LENGTH = len(PREFIX_B)
 
 
+@lru_cache(maxsize=8192)
 def offset_to_cursor(offset: int) -> ConnectionCursor:
-    """Create the cursor string from an offset."""
-    return base64(f"{PREFIX}{offset}")
+    """Create the cursor string from an offset.
+
+    Since pagination offsets cluster in small ranges, the results are
+    memoized so that repeated calls become a single cache lookup.
+    """
+    return b2a_base64(_PREFIX_FORMAT % offset, newline=False).decode("ascii")
 
 
 def cursor_to_offset(cursor: ConnectionCursor) -> Optional[int]:
     """Extract the offset from the cursor string."""
     try:
-        return int(unbase64(cursor)[len(PREFIX) :])
+        # binascii.Error is a subclass of ValueError,
+        # so this also covers invalid Base64 input
+        return int(a2b_base64(cursor)[_PREFIX_LENGTH:])
     except ValueError:
         return None
 
 
+def _cursors_for_range(start: int, count: int) -> List[ConnectionCursor]:
+    """Create the cursors for a contiguous range of offsets.
+
+    Hoists the name lookups out of the per-edge loop so that building a
+    page of cursors stays a tight comprehension.
+    """
+    cursor = offset_to_cursor
+    return [cursor(offset) for offset in range(start, start + count)]
+
+
 def cursor_for_object_in_connection(
     data: Sequence, obj: Any
 ) -> Optional[ConnectionCursor]:
     """Return the cursor associated with an object in a sequence.
 
     This function uses the `index` method of the sequence if it exists,
-    otherwise searches the object by iterating via the `__getitem__` method.
+    otherwise searches the object by iterating over the sequence.
     """
     try:
         offset = data.index(obj)
     except AttributeError:
-        # data does not have an index method
-        offset = 0
-        try:
-            while True:
-                if data[offset] == obj:
-                    break
-                offset += 1
-        except IndexError:
-            return None
-        else:
-            return offset_to_cursor(offset)
+        # data does not have an index method, fall back to a linear scan
+        for offset, item in enumerate(data):
+            if item == obj:
+                return offset_to_cursor(offset)
+        return None
     except ValueError:
         return None
     else:
         return offset_to_cursor(offset)
 
 
+def build_cursor_index(data: Sequence) -> Dict[Any, int]:
+    """Build an index mapping the objects of a sequence to their offsets.
+
+    When resolving cursors for many objects in the same sequence, calling
+    `cursor_for_object_in_connection` repeatedly searches the sequence once
+    per object. This function builds the lookup index in a single pass so
+    that `cursor_for_object_in_connection_indexed` can then resolve each
+    cursor in constant time.
+
+    Objects are keyed by value; if the sequence contains unhashable objects,
+    they are keyed by identity instead. For duplicate objects the offset of
+    the first occurrence is kept, matching the search functions.
+    """
+    index: Dict[Any, int] = {}
+    try:
+        for offset, obj in enumerate(data):
+            index.setdefault(obj, offset)
+    except TypeError:
+        # data contains unhashable objects, key them by identity instead
+        index = {}
+        for offset, obj in enumerate(data):
+            index.setdefault(id(obj), offset)
+    return index
+
+
+def cursor_for_object_in_connection_indexed(
+    index: Dict[Any, int], obj: Any
+) -> Optional[ConnectionCursor]:
+    """Return the cursor associated with an object using a prebuilt index.
+
+    The index must have been created with `build_cursor_index` from the
+    sequence the object belongs to. This is the preferred way to resolve
+    cursors for a batch of objects from the same sequence.
+    """
+    try:
+        offset = index.get(obj)
+    except TypeError:
+        # obj is unhashable, it can only be found by identity
+        offset = None
+    if offset is None:
+        offset = index.get(id(obj))
+    return None if offset is None else offset_to_cursor(offset)
+
+
 def _handle_first_after(
     array_slice: SizedSliceable,
     array_length: Optional[int],
@@ -228,7 +420,14 @@ def _handle_first_after(
     after: Optional[str],
     slice_start: int = 0,
     edge_type: EdgeConstructor = Edge,
-) -> Tuple[List[EdgeType], bool, bool]:
+    lazy: bool = False,
+) -> Tuple[
+    Iterable[EdgeType],
+    bool,
+    bool,
+    Optional[ConnectionCursor],
+    Optional[ConnectionCursor],
+]:
     """Handle the `first` and `after` arguments."""
     if first is not None and first < 0:
         raise ValueError("Argument 'first' must be a non-negative integer.")
@@ -257,7 +456,8 @@ def _handle_first_after(
         if end_offset > array_length:
             end_offset = array_length
 
-    trimmed_slice: SizedSliceable
+    trimmed_slice: Iterable
+    trimmed_slice_length: int
     has_previous_page: bool
     has_next_page: bool
 
@@ -269,16 +469,14 @@ def _handle_first_after(
         # Keep intermediate `intermediate_slice_length` variable to force QuerySet evaluation.
         intermediate_slice_length: int = len(intermediate_slice)
 
-        trimmed_slice = intermediate_slice[: end_offset - start_offset]
-        trimmed_slice_length: int = len(trimmed_slice)
+        # Trim the extra element off lazily instead of copying the slice again.
+        page_size: int = end_offset - start_offset
+        trimmed_slice = islice(intermediate_slice, page_size)
+        trimmed_slice_length = min(intermediate_slice_length, page_size)
 
-        has_next_page = intermediate_slice_length > trimmed_slice_length
+        has_next_page = intermediate_slice_length > page_size
 
     else:
-        trimmed_slice = array_slice[
-            start_offset - slice_start : end_offset - slice_start
-        ]
-
         first_edge_offset: int = 0
         if after_offset is not None:
             if 0 <= after_offset < array_length:
@@ -286,6 +484,35 @@ def _handle_first_after(
         last_edge_offset: int = array_length - 1
         has_next_page = last_edge_offset - first_edge_offset + 1 > first
 
+        if end_offset <= start_offset:
+            # An empty page was requested (e.g. `first: 0`): skip slicing,
+            # which may otherwise trigger a query on lazy sliceables.
+            trimmed_slice = ()
+            trimmed_slice_length = 0
+        elif isinstance(array_slice, list):
+            start_index = start_offset - slice_start
+            stop_index = min(end_offset - slice_start, len(array_slice))
+            if start_index == 0:
+                # The page starts at the front of the list: iterate the
+                # window lazily instead of copying it out of the list.
+                trimmed_slice = islice(array_slice, stop_index)
+                trimmed_slice_length = stop_index
+            else:
+                # For deeper pages islice would walk the list from the
+                # start, and it does not support the negative start index
+                # that an out-of-range `after` cursor can produce, so use
+                # a plain slice, which is O(page) either way.
+                sliced_list = array_slice[start_index:stop_index]
+                trimmed_slice = sliced_list
+                trimmed_slice_length = len(sliced_list)
+        else:
+            trimmed_slice = array_slice[
+                start_offset - slice_start : end_offset - slice_start
+            ]
+            # The length is already known from the offsets, since `end_offset`
+            # has been cropped to the length of the array.
+            trimmed_slice_length = end_offset - start_offset
+
     # If the start offset is greater than zero, there is a previous page.
     # However, if the provided `after` cursor is outside the bounds of the slice,
     # enforce that `has_previous_page` is `True`.
@@ -294,18 +521,34 @@ def _handle_first_after(
         if after_offset > array_length:
             has_previous_page = True
 
-    edges = [
-        edge_type(
-            node=node,
-            cursor=offset_to_cursor(start_offset + index),
+    cursors = _cursors_for_range(start_offset, trimmed_slice_length)
+    edges: Iterable[EdgeType]
+    if lazy:
+        # Build the edge objects on demand; the cursor list already covers
+        # exactly the returned page, so the page info is known up front.
+        edges = (
+            edge_type(node=node, cursor=cursor)
+            for node, cursor in zip(trimmed_slice, cursors)
         )
-        for index, node in enumerate(trimmed_slice)
-    ]
+        edge_count = len(cursors)
+    else:
+        edges = [
+            edge_type(node=node, cursor=cursor)
+            for node, cursor in zip(trimmed_slice, cursors)
+        ]
+        edge_count = len(edges)
+
+    # The boundary cursors are already known, so they are returned here
+    # instead of being read back from the edge objects.
+    first_edge_cursor = cursors[0] if edge_count else None
+    last_edge_cursor = cursors[edge_count - 1] if edge_count else None
 
     return (
         edges,
         has_previous_page,
         has_next_page,
+        first_edge_cursor,
+        last_edge_cursor,
     )
 
 
@@ -316,7 +559,14 @@ def _handle_last_before(
     before: Optional[str],
     slice_start: int = 0,
     edge_type: EdgeConstructor = Edge,
-) -> Tuple[List[EdgeType], bool, bool]:
+    lazy: bool = False,
+) -> Tuple[
+    Iterable[EdgeType],
+    bool,
+    bool,
+    Optional[ConnectionCursor],
+    Optional[ConnectionCursor],
+]:
     """Handle the `last` and `before` arguments."""
 
     if last is not None and last < 0:
@@ -344,26 +594,66 @@ def _handle_last_before(
     # ensuring that it is greater than or equal to zero, or to the start of slice (whichever is greater).
     start_offset: int = max(end_offset - last, max(slice_start, 0))
 
-    trimmed_slice: SizedSliceable = array_slice[
-        start_offset - slice_start : end_offset - slice_start
-    ]
-
     has_previous_page: bool = start_offset > 0
 
     has_next_page: bool = end_offset < array_length
     if before_offset is not None and before_offset < 0:
         has_next_page = True
 
-    edges = [
-        edge_type(
-            node=node,
-            cursor=offset_to_cursor(start_offset + index),
+    trimmed_slice: Iterable
+    trimmed_slice_length: int
+    if end_offset <= start_offset:
+        # An empty page was requested (e.g. `last: 0`): skip slicing,
+        # which may otherwise trigger a query on lazy sliceables.
+        trimmed_slice = ()
+        trimmed_slice_length = 0
+    elif isinstance(array_slice, list):
+        start_index = start_offset - slice_start
+        stop_index = min(end_offset - slice_start, len(array_slice))
+        if start_index == 0:
+            # The page starts at the front of the list: iterate the
+            # window lazily instead of copying it out of the list.
+            trimmed_slice = islice(array_slice, stop_index)
+            trimmed_slice_length = stop_index
+        else:
+            # For deeper pages islice would walk the list from the start,
+            # so use a plain slice, which is O(page) either way.
+            sliced_list = array_slice[start_index:stop_index]
+            trimmed_slice = sliced_list
+            trimmed_slice_length = len(sliced_list)
+    else:
+        sliced: SizedSliceable = array_slice[
+            start_offset - slice_start : end_offset - slice_start
+        ]
+        trimmed_slice = sliced
+        trimmed_slice_length = len(sliced)
+
+    cursors = _cursors_for_range(start_offset, trimmed_slice_length)
+    edges: Iterable[EdgeType]
+    if lazy:
+        # Build the edge objects on demand; the cursor list already covers
+        # exactly the returned page, so the page info is known up front.
+        edges = (
+            edge_type(node=node, cursor=cursor)
+            for node, cursor in zip(trimmed_slice, cursors)
         )
-        for index, node in enumerate(trimmed_slice)
-    ]
+        edge_count = len(cursors)
+    else:
+        edges = [
+            edge_type(node=node, cursor=cursor)
+            for node, cursor in zip(trimmed_slice, cursors)
+        ]
+        edge_count = len(edges)
+
+    # The boundary cursors are already known, so they are returned here
+    # instead of being read back from the edge objects.
+    first_edge_cursor = cursors[0] if edge_count else None
+    last_edge_cursor = cursors[edge_count - 1] if edge_count else None
 
     return (
         edges,
         has_previous_page,
         has_next_page,
+        first_edge_cursor,
+        last_edge_cursor,
     )
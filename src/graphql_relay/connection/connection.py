@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, NamedTuple, Optional, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
 
 from graphql import (
     get_named_type,
@@ -219,7 +219,7 @@ class ConnectionConstructor(Protocol):
     def __call__(
         self,
         *,
-        edges: List[EdgeType],
+        edges: Iterable[EdgeType],
         pageInfo: PageInfoType,
     ) -> ConnectionType:
         ...
@@ -39,6 +39,12 @@ class NullResult:
         self.clientMutationId = clientMutationId
 
 
+# The clientMutationId fields are identical for all mutations,
+# so they are created only once and shared between the types.
+_client_mutation_id_input_field = GraphQLInputField(GraphQLString)
+_client_mutation_id_output_field = GraphQLField(GraphQLString)
+
+
 def mutation_with_client_mutation_id(
     name: str,
     input_fields: ThunkMapping[GraphQLInputField],
@@ -64,29 +70,40 @@ def mutation_with_client_mutation_id(
     """
 
     def augmented_input_fields() -> GraphQLInputFieldMap:
-        return dict(
-            resolve_thunk(input_fields),
-            clientMutationId=GraphQLInputField(GraphQLString),
-        )
+        return {
+            **resolve_thunk(input_fields),
+            "clientMutationId": _client_mutation_id_input_field,
+        }
 
     def augmented_output_fields() -> GraphQLFieldMap:
-        return dict(
-            resolve_thunk(output_fields),
-            clientMutationId=GraphQLField(GraphQLString),
-        )
+        return {
+            **resolve_thunk(output_fields),
+            "clientMutationId": _client_mutation_id_output_field,
+        }
 
     output_type = GraphQLObjectType(name + "Payload", fields=augmented_output_fields)
 
     input_type = GraphQLInputObjectType(name + "Input", fields=augmented_input_fields)
 
+    # The names used in the resolvers are bound as parameter defaults,
+    # so that the per-request calls only use local loads.
     if iscoroutinefunction(mutate_and_get_payload):
         # noinspection PyShadowingBuiltins
-        async def resolve(_root: Any, info: GraphQLResolveInfo, input: Dict) -> Any:
-            payload = await mutate_and_get_payload(info, **input)
+        async def resolve(
+            _root: Any,
+            info: GraphQLResolveInfo,
+            input: Dict,
+            _mutate: MutationFn = mutate_and_get_payload,
+            _null_result: Callable = NullResult,
+            _mapping: type = Mapping,
+        ) -> Any:
+            payload = await _mutate(info, **input)
+            # Note: `clientMutationId` is a nullable input field, so clients
+            # may omit it and a guarded lookup is required here.
             clientMutationId = input.get("clientMutationId")
             if payload is None:
-                return NullResult(clientMutationId)
-            if isinstance(payload, Mapping):
+                return _null_result(clientMutationId)
+            if isinstance(payload, _mapping):
                 payload["clientMutationId"] = clientMutationId  # type: ignore
             else:
                 payload.clientMutationId = clientMutationId
@@ -95,13 +112,18 @@ def mutation_with_client_mutation_id(
     else:
         # noinspection PyShadowingBuiltins
         def resolve(  # type: ignore
-            _root: Any, info: GraphQLResolveInfo, input: Dict
+            _root: Any,
+            info: GraphQLResolveInfo,
+            input: Dict,
+            _mutate: MutationFn = mutate_and_get_payload,
+            _null_result: Callable = NullResult,
+            _mapping: type = Mapping,
         ) -> Any:
-            payload = mutate_and_get_payload(info, **input)
+            payload = _mutate(info, **input)
             clientMutationId = input.get("clientMutationId")
             if payload is None:
-                return NullResult(clientMutationId)
-            if isinstance(payload, Mapping):
+                return _null_result(clientMutationId)
+            if isinstance(payload, _mapping):
                 payload["clientMutationId"] = clientMutationId  # type: ignore
             else:
                 payload.clientMutationId = clientMutationId  # type: ignore
@@ -1,7 +1,7 @@
+from base64 import b64decode, b64encode
+from functools import lru_cache
 from typing import Any, Callable, NamedTuple, Optional, Union
 
-from graphql_relay.utils.base64 import base64, unbase64
-
 from graphql import (
     GraphQLArgument,
     GraphQLNonNull,
@@ -86,23 +86,46 @@ class ResolvedGlobalId(NamedTuple):
     id: str
 
 
+@lru_cache(maxsize=8192)
+def _encode_global_id(type_: str, id_: str) -> str:
+    """Encode a type name and an already serialized ID as a global ID.
+
+    Only the encode step is memoized, keyed on the serialized ID, so that
+    `to_global_id` always validates its arguments regardless of cache state.
+    """
+    return b64encode(f"{type_}:{id_}".encode("utf-8")).decode("ascii")
+
+
 def to_global_id(type_: str, id_: Union[str, int]) -> str:
     """
     Takes a type name and an ID specific to that type name, and returns a
     "global ID" that is unique among all types.
+
+    Since the same objects tend to be resolved over and over in read-heavy
+    schemas, the results are memoized.
     """
-    return base64(f"{type_}:{GraphQLID.serialize(id_)}")
+    return _encode_global_id(type_, GraphQLID.serialize(id_))
 
 
+@lru_cache(maxsize=4096)
 def from_global_id(global_id: str) -> ResolvedGlobalId:
     """
     Takes the "global ID" created by to_global_id, and returns the type name and ID
     used to create it.
+
+    In steady-state Relay traffic the same global IDs are refetched over and
+    over, so the results are memoized.
     """
-    global_id = unbase64(global_id)
-    if ":" not in global_id:
-        return ResolvedGlobalId("", global_id)
-    return ResolvedGlobalId(*global_id.split(":", 1))
+    try:
+        # UnicodeEncodeError, binascii.Error and UnicodeDecodeError
+        # are all subclasses of ValueError
+        unbased_global_id = b64decode(global_id).decode("utf-8")
+    except ValueError:
+        unbased_global_id = ""
+    type_, separator, id_ = unbased_global_id.partition(":")
+    if not separator:
+        return ResolvedGlobalId("", type_)
+    return ResolvedGlobalId(type_, id_)
 
 
 def global_id_field(
@@ -4,9 +4,12 @@ import pytest
 from pytest import deprecated_call, raises
 
 from graphql_relay import (
+    build_cursor_index,
     connection_from_array,
     connection_from_array_slice,
+    connection_from_array_slice_streaming,
     cursor_for_object_in_connection,
+    cursor_for_object_in_connection_indexed,
     offset_to_cursor,
     Connection,
     Edge,
@@ -773,9 +776,174 @@ def describe_connection_from_array():
                 )
                 assert no_letter_cursor is None
 
+    def describe_streaming():
+        """Test functionality that is not part of graphql-relay-js."""
+
+        def returns_the_edges_as_a_lazy_iterator():
+            c = connection_from_array_slice_streaming(array_abcde, dict(first=2))
+            assert isinstance(c, Connection)
+            assert not isinstance(c.edges, list)
+            assert c.pageInfo == PageInfo(
+                startCursor=cursor_a,
+                endCursor=cursor_b,
+                hasPreviousPage=False,
+                hasNextPage=True,
+            )
+            assert list(c.edges) == [edge_a, edge_b]
+
+        def streams_backward_pagination_as_well():
+            c = connection_from_array_slice_streaming(array_abcde, dict(last=2))
+            assert c.pageInfo == PageInfo(
+                startCursor=cursor_d,
+                endCursor=cursor_e,
+                hasPreviousPage=True,
+                hasNextPage=False,
+            )
+            assert list(c.edges) == [edge_d, edge_e]
+
+        def streams_an_empty_page():
+            c = connection_from_array_slice_streaming(array_abcde, dict(first=0))
+            assert c.pageInfo == PageInfo(
+                startCursor=None,
+                endCursor=None,
+                hasPreviousPage=False,
+                hasNextPage=True,
+            )
+            assert list(c.edges) == []
+
+    def describe_cursor_for_object_in_connection_indexed():
+        """Test functionality that is not part of graphql-relay-js."""
+
+        def returns_an_edges_cursor_given_a_prebuilt_index():
+            index = build_cursor_index(array_abcde)
+            letter_b_cursor = cursor_for_object_in_connection_indexed(index, "B")
+            assert letter_b_cursor == cursor_b
+
+        def returns_null_given_a_non_member_object():
+            index = build_cursor_index(array_abcde)
+            letter_f_cursor = cursor_for_object_in_connection_indexed(index, "F")
+            assert letter_f_cursor is None
+
+        def keeps_the_first_occurrence_of_duplicate_objects():
+            index = build_cursor_index(["A", "B", "B"])
+            letter_b_cursor = cursor_for_object_in_connection_indexed(index, "B")
+            assert letter_b_cursor == cursor_b
+
+        def falls_back_to_identity_for_unhashable_objects():
+            letters = [["A"], ["B"]]
+            index = build_cursor_index(letters)
+            letter_b_cursor = cursor_for_object_in_connection_indexed(index, letters[1])
+            assert letter_b_cursor == cursor_b
+
+            no_letter_cursor = cursor_for_object_in_connection_indexed(index, ["C"])
+            assert no_letter_cursor is None
+
     def describe_extended_functionality():
         """Test functionality that is not part of graphql-relay-js."""
 
+        def does_not_call_len_when_first_is_provided():
+            class SliceableWithoutLen:
+                def __getitem__(self, index):
+                    return array_abcde[index]
+
+                def __len__(self):  # pragma: no cover
+                    raise AssertionError("len() should not be called")
+
+            c = connection_from_array_slice(
+                cast(Sequence, SliceableWithoutLen()), dict(first=2)
+            )
+            assert c == Connection(
+                edges=[edge_a, edge_b],
+                pageInfo=PageInfo(
+                    startCursor=cursor_a,
+                    endCursor=cursor_b,
+                    hasPreviousPage=False,
+                    hasNextPage=True,
+                ),
+            )
+
+        def does_not_slice_the_array_for_an_empty_page():
+            class NotSliceable(list):
+                def __getitem__(self, index):  # pragma: no cover
+                    raise AssertionError("array should not be sliced")
+
+            c = connection_from_array(NotSliceable(array_abcde), dict(first=0))
+            assert c == Connection(
+                edges=[],
+                pageInfo=PageInfo(
+                    startCursor=None,
+                    endCursor=None,
+                    hasPreviousPage=False,
+                    hasNextPage=True,
+                ),
+            )
+
+            c = connection_from_array(NotSliceable(array_abcde), dict(last=0))
+            assert c == Connection(
+                edges=[],
+                pageInfo=PageInfo(
+                    startCursor=None,
+                    endCursor=None,
+                    hasPreviousPage=True,
+                    hasNextPage=False,
+                ),
+            )
+
+        def returns_an_empty_page_for_a_crossed_range():
+            # A `before` cursor below the `slice_start` yields a range that
+            # ends before it starts; this must give an empty page instead of
+            # wrapping around via negative slice indices.
+            expected = Connection(
+                edges=[],
+                pageInfo=PageInfo(
+                    startCursor=None,
+                    endCursor=None,
+                    hasPreviousPage=True,
+                    hasNextPage=True,
+                ),
+            )
+            args = dict(before=offset_to_cursor(0))
+            c = connection_from_array_slice(
+                array_abcde, args, slice_start=1, array_length=5
+            )
+            assert c == expected
+            c = connection_from_array_slice(
+                tuple(array_abcde), args, slice_start=1, array_length=5
+            )
+            assert c == expected
+
+        def handles_an_out_of_range_after_cursor_with_a_slice_start():
+            expected = Connection(
+                edges=[],
+                pageInfo=PageInfo(
+                    startCursor=None,
+                    endCursor=None,
+                    hasPreviousPage=True,
+                    hasNextPage=False,
+                ),
+            )
+            args = dict(after=offset_to_cursor(7))
+            c = connection_from_array_slice(
+                array_abcde, args, slice_start=1, array_length=5
+            )
+            assert c == expected
+            c = connection_from_array_slice(
+                tuple(array_abcde), args, slice_start=1, array_length=5
+            )
+            assert c == expected
+
+        def paginates_backward_over_a_non_list_sliceable():
+            c = connection_from_array(tuple(array_abcde), dict(last=2, before=cursor_e))
+            assert c == Connection(
+                edges=[edge_c, edge_d],
+                pageInfo=PageInfo(
+                    startCursor=cursor_c,
+                    endCursor=cursor_d,
+                    hasPreviousPage=True,
+                    hasNextPage=True,
+                ),
+            )
+
         def does_not_require_args():
             c = connection_from_array(array_abcde)
             assert c == Connection(
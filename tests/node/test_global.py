@@ -1,9 +1,14 @@
-from typing import Any, NamedTuple, Optional
+import os
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, NamedTuple
 
 from pytest import fixture
 
 from graphql import (
-    graphql_sync,
+    execute_sync,
+    parse,
+    validate,
     GraphQLField,
     GraphQLList,
     GraphQLInt,
@@ -16,19 +21,50 @@ from graphql import (
 from graphql_relay import from_global_id, global_id_field, node_definitions
 
 
+# The schema identity asserts in the resolvers can be switched off with
+# RELAY_SKIP_SCHEMA_CHECK=1 when profiling resolver overhead. The helper
+# is chosen once at import time, so the resolvers contain no branch.
+if os.environ.get("RELAY_SKIP_SCHEMA_CHECK") == "1":  # pragma: no cover
+
+    def check_schema(info: GraphQLResolveInfo, schema: GraphQLSchema) -> None:
+        """Skip the schema identity check when profiling."""
+
+else:
+
+    def check_schema(info: GraphQLResolveInfo, schema: GraphQLSchema) -> None:
+        """Assert that the resolver was called with the expected schema."""
+        assert info.schema is schema
+
+
+@lru_cache(maxsize=None)
+def prepared_query(schema, source):
+    """Parse and validate a query only once per schema and source."""
+    document = parse(source)
+    assert not validate(schema, document)
+    return document
+
+
+def execute_query(schema, source):
+    """Execute a query, reusing the parsed and validated document."""
+    return execute_sync(schema, prepared_query(schema, source))
+
+
 class User(NamedTuple):
     id: str
     name: str
+    typename: str
 
 
 class Photo(NamedTuple):
     photo_id: str
     width: int
+    typename: str
 
 
 class Post(NamedTuple):
     id: str
     text: str
+    typename: str
 
 
 @fixture(scope="module", params=["object_access", "dict_access"])
@@ -36,72 +72,58 @@ def schema(request):
     """Run each test with object access and dict access."""
     use_dicts = request.param == "dict_access"
 
+    # Each record carries its GraphQL type name, so that resolving the
+    # node type is a single read instead of probing the record's shape.
     user_cls = dict if use_dicts else User
     user_data = [
-        user_cls(id="1", name="John Doe"),
-        user_cls(id="2", name="Jane Smith"),
+        user_cls(id="1", name="John Doe", typename="User"),
+        user_cls(id="2", name="Jane Smith", typename="User"),
     ]
 
     photo_cls = dict if use_dicts else Photo
     photo_data = [
-        photo_cls(photo_id="1", width=300),
-        photo_cls(photo_id="2", width=400),
+        photo_cls(photo_id="1", width=300, typename="Photo"),
+        photo_cls(photo_id="2", width=400, typename="Photo"),
     ]
 
     post_cls = dict if use_dicts else Post
-    post_data = [post_cls(id="1", text="lorem"), post_cls(id="2", text="ipsum")]
+    post_data = [
+        post_cls(id="1", text="lorem", typename="Post"),
+        post_cls(id="2", text="ipsum", typename="Post"),
+    ]
 
+    # Index the records by their id once, so that node lookup is a dict
+    # access instead of a linear scan over the data lists.
     if use_dicts:
-
-        def get_node(global_id: str, info: GraphQLResolveInfo) -> Any:
-            assert info.schema is schema
-            type_, id_ = from_global_id(global_id)
-            if type_ == "User":
-                return next(filter(lambda obj: obj["id"] == id_, user_data), None)
-            if type_ == "Photo":
-                return next(
-                    filter(lambda obj: obj["photo_id"] == id_, photo_data), None
-                )
-            if type_ == "Post":
-                return next(filter(lambda obj: obj["id"] == id_, post_data), None)
-            return None  # pragma: no cover
-
-        def get_node_type(
-            obj: Any, info: GraphQLResolveInfo, _type: Any
-        ) -> Optional[str]:
-            assert info.schema is schema
-            if "name" in obj:
-                return user_type.name
-            if "photo_id" in obj:
-                return photo_type.name
-            if "text" in obj:
-                return post_type.name
-            return None  # pragma: no cover
-
+        users_by_id = {obj["id"]: obj for obj in user_data}
+        photos_by_id = {obj["photo_id"]: obj for obj in photo_data}
+        posts_by_id = {obj["id"]: obj for obj in post_data}
     else:
-
-        def get_node(global_id: str, info: GraphQLResolveInfo) -> Any:
-            assert info.schema is schema
-            type_, id_ = from_global_id(global_id)
-            if type_ == "User":
-                return next(filter(lambda obj: obj.id == id_, user_data), None)
-            if type_ == "Photo":
-                return next(filter(lambda obj: obj.photo_id == id_, photo_data), None)
-            if type_ == "Post":
-                return next(filter(lambda obj: obj.id == id_, post_data), None)
+        users_by_id = {obj.id: obj for obj in user_data}
+        photos_by_id = {obj.photo_id: obj for obj in photo_data}
+        posts_by_id = {obj.id: obj for obj in post_data}
+
+    # Dispatch node lookups with a single dict access on the type name
+    # instead of a chain of comparisons.
+    finders = {
+        "User": users_by_id.get,
+        "Photo": photos_by_id.get,
+        "Post": posts_by_id.get,
+    }
+
+    def get_node(global_id: str, info: GraphQLResolveInfo) -> Any:
+        check_schema(info, schema)
+        type_, id_ = from_global_id(global_id)
+        finder = finders.get(type_)
+        if finder is None:
             return None  # pragma: no cover
+        return finder(id_)
 
-        def get_node_type(
-            obj: Any, info: GraphQLResolveInfo, _type: Any
-        ) -> Optional[str]:
-            assert info.schema is schema
-            if isinstance(obj, User):
-                return user_type.name
-            if isinstance(obj, Photo):
-                return photo_type.name
-            if isinstance(obj, Post):
-                return post_type.name
-            return None  # pragma: no cover
+    get_typename = itemgetter("typename") if use_dicts else attrgetter("typename")
+
+    def get_node_type(obj: Any, info: GraphQLResolveInfo, _type: Any) -> str:
+        check_schema(info, schema)
+        return get_typename(obj)
 
     node_interface, node_field = node_definitions(get_node, get_node_type)[:2]
 
@@ -114,13 +136,14 @@ def schema(request):
         interfaces=[node_interface],
     )
 
+    # Pick a C-implemented getter for the photo id once,
+    # instead of branching on the access mode in every resolve.
+    get_photo_id = itemgetter("photo_id") if use_dicts else attrgetter("photo_id")
+
     photo_type = GraphQLObjectType(
         "Photo",
         fields=lambda: {
-            "id": global_id_field(
-                "Photo",
-                lambda obj, _info: obj["photo_id"] if use_dicts else obj.photo_id,
-            ),
+            "id": global_id_field("Photo", lambda obj, _info: get_photo_id(obj)),
             "width": GraphQLField(GraphQLInt),
         },
         interfaces=[node_interface],
@@ -132,19 +155,28 @@ def schema(request):
         interfaces=[node_interface],
     )
 
+    # The data is static, so the result can be built once
+    # instead of allocating a fresh list on every resolve.
+    all_objects = (*user_data, *photo_data, *post_data)
+
     query_type = GraphQLObjectType(
         "Query",
         fields=lambda: {
             "node": node_field,
             "allObjects": GraphQLField(
                 GraphQLList(node_interface),
-                resolve=lambda _root, _info: [*user_data, *photo_data, *post_data],
+                resolve=lambda _root, _info: all_objects,
             ),
         },
     )
 
     schema = GraphQLSchema(query=query_type, types=[user_type, photo_type, post_type])
 
+    # Force evaluation of the lazy field thunks up front, so that the
+    # first query executed against the schema does not pay for it.
+    for named_type in schema.type_map.values():
+        getattr(named_type, "fields", None)
+
     yield schema
 
 
@@ -157,7 +189,7 @@ def describe_global_id_fields():
           }
         }
         """
-        assert graphql_sync(schema, source) == (
+        assert execute_query(schema, source) == (
             {
                 "allObjects": [
                     {"id": "VXNlcjox"},
@@ -194,7 +226,7 @@ def describe_global_id_fields():
           }
         }
         """
-        assert graphql_sync(schema, source) == (
+        assert execute_query(schema, source) == (
             {
                 "user": {"id": "VXNlcjox", "name": "John Doe"},
                 "photo": {"id": "UGhvdG86MQ==", "width": 300},